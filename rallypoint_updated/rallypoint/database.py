@@ -3,7 +3,12 @@ Database utilities for the Rallypoint application.
 
 This module encapsulates all direct interactions with the SQLite database.
 It exposes helper functions to initialize the database schema and provide
-connections in a context-managed fashion.
+connections in a context-managed fashion. Connections are long-lived: readers
+borrow one from a small process-wide pool and writers share a single
+dedicated connection guarded by a lock, since SQLite allows only one writer.
+The query helpers below always pass the same SQL text, so each long-lived
+connection's prepared-statement cache is hit instead of re-parsing the SQL.
+Results of the list queries are cached in memory until the database changes.
 
 Tables
 ------
@@ -13,36 +18,187 @@ service_requests
         name TEXT NOT NULL
         email TEXT NOT NULL
         description TEXT NOT NULL
-        created_at TEXT (ISO-8601 timestamp)
+        created_at INTEGER NOT NULL (microseconds since the Unix epoch, UTC, indexed)
 
 job_postings
     Stores job postings created by admins. Fields:
         id INTEGER PRIMARY KEY AUTOINCREMENT
         title TEXT NOT NULL
         description TEXT NOT NULL
-        created_at TEXT (ISO-8601 timestamp)
+        created_at INTEGER NOT NULL (microseconds since the Unix epoch, UTC, indexed)
+
+recommendations
+    Caches AI-generated staffing recommendations so they survive restarts and
+    are shared between worker processes. Fields:
+        description_hash TEXT PRIMARY KEY (BLAKE2b hex digest of the description)
+        data TEXT NOT NULL (JSON-encoded recommendation)
+
+``ORDER BY created_at DESC`` is answered by walking the ``created_at`` indexes
+without a separate sort. Databases from before timestamps were stored as
+integers (``created_at TEXT`` holding ISO-8601 strings) are converted by
+:func:`init_db`.
 """
 
-import sqlite3
+import os
+import queue
+import threading
+from collections import namedtuple
 from contextlib import contextmanager
+from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Prefer the optional ``pysqlite3`` package when it is installed: it is a
+# drop-in replacement for the stdlib module that bundles a current SQLite
+# build (newer query planner and PRAGMA optimize improvements). Otherwise use
+# whatever SQLite the interpreter was built against.
+try:
+    from pysqlite3 import dbapi2 as sqlite3  # type: ignore
+except ImportError:
+    import sqlite3
 
 
 # Name of the SQLite database file.
 DB_NAME = "rallypoint.db"
 
+# Stored in ``PRAGMA user_version`` once the schema is up to date.
+SCHEMA_VERSION = 2
+
+# PRAGMAs applied to every connection. WAL lets readers proceed while a write
+# is in flight and ``synchronous=NORMAL`` only syncs at checkpoints, which is
+# still durable under WAL. The negative ``cache_size`` is in KiB (64 MiB).
+_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL;"
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA cache_size=-64000;"
+    "PRAGMA mmap_size=268435456;"
+)
+
+
+def _apply_pragmas(conn: sqlite3.Connection) -> None:
+    """Configure journal mode and performance PRAGMAs on ``conn``.
+
+    WAL is not available for in-memory databases, so the journal mode is only
+    switched when the database lives on disk.
+    """
+    if DB_NAME != ":memory:":
+        conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(_PRAGMAS)
+
+
+# Maximum number of idle reader connections kept around for reuse.
+POOL_SIZE = int(os.getenv("RALLYPOINT_DB_POOL_SIZE", "4"))
+
+_pool: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=POOL_SIZE)
+_writer: Optional[sqlite3.Connection] = None
+_write_lock = threading.Lock()
+
+# Size of each connection's prepared-statement cache.
+_STATEMENT_CACHE_SIZE = 128
+
+# Hot statements, kept as constants so every call hits the statement cache.
+_INSERT_SERVICE_REQUEST = (
+    "INSERT INTO service_requests (name, email, description, created_at) VALUES (?, ?, ?, ?)"
+)
+_INSERT_JOB_POSTING = "INSERT INTO job_postings (title, description, created_at) VALUES (?, ?, ?)"
+_SELECT_SERVICE_REQUESTS = (
+    "SELECT id, name, email, description, created_at FROM service_requests ORDER BY created_at DESC"
+)
+_SELECT_JOB_POSTINGS = "SELECT id, title, description, created_at FROM job_postings ORDER BY created_at DESC"
+_SELECT_RECOMMENDATION = "SELECT data FROM recommendations WHERE description_hash = ?"
+_UPSERT_RECOMMENDATION = "INSERT OR REPLACE INTO recommendations (description_hash, data) VALUES (?, ?)"
+
+# Row types returned by the list helpers.
+ServiceRequest = namedtuple("ServiceRequest", "id name email description created_at")
+JobPosting = namedtuple("JobPosting", "id title description created_at")
+
+# Results of the list queries keyed by SQL, each stored with the
+# ``PRAGMA data_version`` it was read at. ``_version_conn`` is a dedicated
+# connection whose data_version changes whenever any other connection commits,
+# including writers in other worker processes.
+_list_cache: Dict[str, Tuple[int, List[Tuple]]] = {}
+_cache_lock = threading.Lock()
+_version_conn: Optional[sqlite3.Connection] = None
+
+# Columns other than ``created_at`` copied when converting a legacy table.
+_LEGACY_COLUMNS = {
+    "service_requests": ("id", "name", "email", "description"),
+    "job_postings": ("id", "title", "description"),
+}
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _iso_to_micros(value: str) -> int:
+    """Convert a naive UTC ISO-8601 timestamp to microseconds since the epoch."""
+    return (datetime.fromisoformat(value) - _EPOCH) // timedelta(microseconds=1)
+
+
+def _connect() -> sqlite3.Connection:
+    """Open a new configured connection that may be shared across threads."""
+    conn = sqlite3.connect(
+        DB_NAME, check_same_thread=False, cached_statements=_STATEMENT_CACHE_SIZE
+    )
+    _apply_pragmas(conn)
+    return conn
+
+
+def close_db() -> None:
+    """Close every long-lived connection held by this module.
+
+    Intended for application shutdown. Connections are reopened lazily if the
+    helpers are used again afterwards.
+    """
+    global _writer, _version_conn
+    while True:
+        try:
+            _pool.get_nowait().close()
+        except queue.Empty:
+            break
+    with _write_lock:
+        if _writer is not None:
+            _writer.close()
+            _writer = None
+    with _cache_lock:
+        if _version_conn is not None:
+            _version_conn.close()
+            _version_conn = None
+        _list_cache.clear()
+
 
 def init_db() -> None:
     """Initialise the SQLite database and create tables if they don't exist.
 
     This function should be called once at application startup. It creates
     the required tables for service requests and job postings. The database
-    file lives in the root of the repository by default.
+    file lives in the root of the repository by default. It also switches the
+    database to WAL mode, which is persisted in the file header.
+
+    The schema is created in a single transaction, after which ``PRAGMA
+    user_version`` is set to :data:`SCHEMA_VERSION`. Later starts see the
+    matching version and return without touching the schema.
     """
     db_path = Path(DB_NAME)
     # Ensure the database directory exists (it's the project root, so fine).
-    with sqlite3.connect(db_path) as conn:
+    conn = sqlite3.connect(db_path)
+    try:
+        _apply_pragmas(conn)
         cursor = conn.cursor()
+        if cursor.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION:
+            return
+        # Take the write lock before re-checking, in case another worker
+        # process is initialising the same file concurrently.
+        cursor.execute("BEGIN IMMEDIATE")
+        if cursor.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION:
+            conn.rollback()
+            return
+        # Move aside tables whose timestamps are still ISO-8601 text; their rows
+        # are copied into the new tables below.
+        legacy_tables = []
+        for table in _LEGACY_COLUMNS:
+            columns = {row[1]: row[2] for row in cursor.execute(f"PRAGMA table_info({table})")}
+            if columns.get("created_at", "").upper() == "TEXT":
+                cursor.execute(f"ALTER TABLE {table} RENAME TO {table}_legacy")
+                legacy_tables.append(table)
         # Create service_requests table
         cursor.execute(
             """
@@ -51,7 +207,7 @@ def init_db() -> None:
                 name TEXT NOT NULL,
                 email TEXT NOT NULL,
                 description TEXT NOT NULL,
-                created_at TEXT NOT NULL
+                created_at INTEGER NOT NULL
             )
             """
         )
@@ -62,11 +218,48 @@ def init_db() -> None:
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 title TEXT NOT NULL,
                 description TEXT NOT NULL,
-                created_at TEXT NOT NULL
+                created_at INTEGER NOT NULL
             )
             """
         )
+        # Create recommendations table
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS recommendations (
+                description_hash TEXT PRIMARY KEY,
+                data TEXT NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+        for table in legacy_tables:
+            columns = ", ".join(_LEGACY_COLUMNS[table])
+            placeholders = ", ".join("?" * (len(_LEGACY_COLUMNS[table]) + 1))
+            rows = cursor.execute(f"SELECT {columns}, created_at FROM {table}_legacy").fetchall()
+            cursor.executemany(
+                f"INSERT INTO {table} ({columns}, created_at) VALUES ({placeholders})",
+                [row[:-1] + (_iso_to_micros(row[-1]),) for row in rows],
+            )
+            # Carry over the AUTOINCREMENT counter, which may be past the
+            # largest copied id if rows were deleted, so ids are never reused.
+            seq = cursor.execute(
+                "SELECT seq FROM sqlite_sequence WHERE name = ?", (f"{table}_legacy",)
+            ).fetchone()
+            if seq is not None:
+                cursor.execute("DELETE FROM sqlite_sequence WHERE name = ?", (table,))
+                cursor.execute("INSERT INTO sqlite_sequence (name, seq) VALUES (?, ?)", (table, seq[0]))
+            cursor.execute(f"DROP TABLE {table}_legacy")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_service_requests_created "
+            "ON service_requests (created_at DESC)"
+        )
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_job_postings_created "
+            "ON job_postings (created_at DESC)"
+        )
+        cursor.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
         conn.commit()
+    finally:
+        conn.close()
 
 
 def reset_data() -> None:
@@ -76,27 +269,144 @@ def reset_data() -> None:
     ``job_postings`` tables. It can be used at application startup to ensure
     that each run of the development server begins with an empty board. It is
     intended for demonstration purposes and should not be used in production.
+
+    Both tables are cleared in a single transaction on the shared write
+    connection, so the reset cannot interleave with a batch of inserts.
     """
-    with sqlite3.connect(DB_NAME) as conn:
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM service_requests")
-        cursor.execute("DELETE FROM job_postings")
+    with get_write_db() as conn:
+        conn.execute("DELETE FROM service_requests")
+        conn.execute("DELETE FROM job_postings")
         conn.commit()
 
 
 @contextmanager
-def get_db() -> sqlite3.Connection:
-    """Context manager for obtaining a SQLite database connection.
+def get_db() -> Iterator[sqlite3.Connection]:
+    """Context manager for borrowing a pooled SQLite database connection.
 
     Usage:
         with get_db() as conn:
             cursor = conn.cursor()
             ...
 
-    Ensures the connection is properly closed after use.
+    The connection is returned to the pool afterwards. If the block raises,
+    the connection is closed instead, as it may be left mid-transaction.
     """
-    conn = sqlite3.connect(DB_NAME)
+    try:
+        conn = _pool.get_nowait()
+    except queue.Empty:
+        conn = _connect()
     try:
         yield conn
-    finally:
-        conn.close()
\ No newline at end of file
+    except BaseException:
+        conn.close()
+        raise
+    try:
+        _pool.put_nowait(conn)
+    except queue.Full:
+        conn.close()
+
+
+@contextmanager
+def get_write_db() -> Iterator[sqlite3.Connection]:
+    """Context manager for the shared write connection.
+
+    Holds the process-wide write lock for the duration of the block so that
+    concurrent writers are serialised here rather than failing with
+    ``database is locked``. Uncommitted changes are rolled back on error.
+    """
+    global _writer
+    with _write_lock:
+        if _writer is None:
+            _writer = _connect()
+        try:
+            yield _writer
+        except BaseException:
+            _writer.rollback()
+            raise
+
+
+def optimize() -> None:
+    """Run ``PRAGMA optimize`` so the planner's statistics track table growth.
+
+    This is cheap when nothing needs re-analysing and is meant to be called
+    at startup and then periodically on long-running processes.
+    """
+    with get_write_db() as conn:
+        conn.execute("PRAGMA optimize")
+
+
+def insert_batch(
+    service_requests: Sequence[Tuple[str, str, str, int]],
+    job_postings: Sequence[Tuple[str, str, int]],
+) -> None:
+    """Insert any number of service requests and job postings at once.
+
+    All rows are written in a single transaction so a burst of submissions
+    pays for one commit (and WAL sync) rather than one per row. Service
+    request rows are ``(name, email, description, created_at)`` and job
+    posting rows are ``(title, description, created_at)``, with ``created_at``
+    in integer microseconds since the Unix epoch.
+    """
+    with get_write_db() as conn:
+        if service_requests:
+            conn.executemany(_INSERT_SERVICE_REQUEST, service_requests)
+        if job_postings:
+            conn.executemany(_INSERT_JOB_POSTING, job_postings)
+        conn.commit()
+
+
+def _data_version() -> int:
+    """Return a counter that changes whenever the database is modified.
+
+    Must be called with ``_cache_lock`` held.
+    """
+    global _version_conn
+    if _version_conn is None:
+        _version_conn = _connect()
+    return _version_conn.execute("PRAGMA data_version").fetchone()[0]
+
+
+def _cached_fetchall(sql: str, row_type: type) -> List[Tuple]:
+    """Run a list query, reusing the previous result if nothing has changed.
+
+    Rows are converted to ``row_type`` once, when they are fetched.
+
+    The returned list is shared between callers and must not be mutated.
+    """
+    with _cache_lock:
+        version = _data_version()
+        cached = _list_cache.get(sql)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+    with get_db() as conn:
+        rows = list(map(row_type._make, conn.execute(sql)))
+    # Tag with the version read *before* the query: a commit racing with the
+    # query bumps the version, so the next call re-reads rather than serving
+    # a possibly stale result.
+    with _cache_lock:
+        _list_cache[sql] = (version, rows)
+    return rows
+
+
+def get_all_service_requests() -> List[ServiceRequest]:
+    """Return every service request, newest first."""
+    return _cached_fetchall(_SELECT_SERVICE_REQUESTS, ServiceRequest)
+
+
+def get_all_job_postings() -> List[JobPosting]:
+    """Return every job posting, newest first."""
+    return _cached_fetchall(_SELECT_JOB_POSTINGS, JobPosting)
+
+
+def get_recommendation(description_hash: str) -> Optional[str]:
+    """Return the stored JSON recommendation for ``description_hash``, if any."""
+    with get_db() as conn:
+        row = conn.execute(_SELECT_RECOMMENDATION, (description_hash,)).fetchone()
+    return row[0] if row is not None else None
+
+
+def save_recommendations(rows: Sequence[Tuple[str, str]]) -> None:
+    """Store ``(description_hash, data)`` JSON recommendations in one transaction."""
+    with get_write_db() as conn:
+        conn.executemany(_UPSERT_RECOMMENDATION, rows)
+        conn.commit()
@@ -16,15 +16,28 @@ The app includes the following routes:
 * ``POST /admin/post_job``: Handle creation of new job postings.
 * ``GET /postings``: Public job board displaying all current postings along with AI-generated recommendations.
 
+Inserts from the two POST endpoints are queued and written in batches by a
+background task started with the application.
+
 To run the application locally use:
 
     uvicorn rallypoint.main:app --reload
 
 """
 
-from datetime import datetime
-from typing import Dict, List, Any
+from datetime import datetime, timedelta
+from collections import OrderedDict, namedtuple
+from contextlib import asynccontextmanager
+from functools import partial
+from types import MappingProxyType
+from typing import AsyncIterator, Dict, List, Any, Mapping, Optional, Set, Tuple, Union
+import asyncio
+import hashlib
 import os
+import re
+import time
+from pathlib import Path
+from urllib.parse import unquote_to_bytes
 import json
 
 # Attempt to import the optional OpenAI client. If unavailable the application
@@ -34,76 +47,926 @@ try:
 except ImportError:
     openai = None  # type: ignore
 
-# Determine whether the OpenAI API is both configured and reachable. We do a
-# small connectivity test on module import: if the `OPENAI_API_KEY` is set and
-# the `openai` library is available, attempt a trivial call to the Chat
-# Completions API. A global flag is set to indicate availability. This avoids
-# silently falling back to heuristics when the API is unreachable but a key
-# is present, and provides informative logging in the server console.
-OPENAI_AVAILABLE = False
-if openai and os.getenv("OPENAI_API_KEY"):
-    api_key = os.getenv("OPENAI_API_KEY")
-    try:
-        # Determine whether we have the new-style OpenAI client. In the new
-        # SDK (>=1.0.0) the `OpenAI` class is available and should be used. In
-        # older versions this attribute does not exist, so we fall back to
-        # using the legacy `openai.ChatCompletion.create` API. We avoid
-        # accessing `openai.ChatCompletion` unless necessary to prevent
-        # triggering the APIRemovedInV1 error.
-        if hasattr(openai, "OpenAI"):
-            client = openai.OpenAI(api_key=api_key)
-            _ = client.chat.completions.create(
-                model="gpt-4-turbo",
-                messages=[{"role": "user", "content": "ping"}],
-                max_tokens=1,
-                temperature=0.0,
-            )
-        else:
+# ``orjson`` is an optional, much faster JSON codec. It is used for parsing
+# model output and as the default response class when installed.
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
+
+if orjson is not None:
+    json_loads = orjson.loads
+
+    def json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+else:
+    json_loads = json.loads
+    json_dumps = json.dumps
+
+# The optional ``pyahocorasick`` package speeds up keyword matching; without it
+# a plain substring scan is used.
+try:
+    import ahocorasick  # type: ignore
+except ImportError:
+    ahocorasick = None  # type: ignore
+
+try:
+    import httpx  # type: ignore
+except ImportError:
+    httpx = None  # type: ignore
+
+# ``fcntl`` is POSIX-only; it lets a single worker claim the startup reset.
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # type: ignore
+
+# HTTP/2 support for ``httpx`` needs the ``h2`` package.
+try:
+    import h2  # type: ignore
+except ImportError:
+    h2 = None  # type: ignore
+
+# Whether recommendations should be requested from OpenAI. No connectivity
+# test is made at import: it slowed every start (and every ``--reload``) by a
+# network round-trip. If the API turns out to be unreachable, the first call
+# fails and falls back to the keyword heuristics.
+OPENAI_AVAILABLE = bool(openai and os.getenv("OPENAI_API_KEY"))
+
+# Shared HTTP client for all outbound calls (OpenAI today), created on startup
+# and exposed as ``app.state.http``. Its keep-alive connections, multiplexed
+# over HTTP/2 when ``h2`` is installed, save a TCP and TLS handshake per call.
+_http_client = None
+
+# Shared asynchronous OpenAI client, created on first use on top of
+# ``_http_client``.
+_openai_client = None
+
+
+def _start_http_client() -> None:
+    global _http_client
+    if httpx is not None:
+        _http_client = httpx.AsyncClient(
+            http2=h2 is not None,
+            limits=httpx.Limits(
+                max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0
+            ),
+            timeout=httpx.Timeout(30.0, connect=10.0),
+        )
+
+
+async def _stop_http_client() -> None:
+    global _http_client, _openai_client
+    if _http_client is not None:
+        await _http_client.aclose()
+    _http_client = _openai_client = None
+
+
+def get_openai_client():
+    """Return the shared ``AsyncOpenAI`` client, creating it on first use.
+
+    Returns ``None`` for the legacy (<1.0) SDK, which has no client object and
+    is configured through ``openai.api_key`` instead. We avoid accessing
+    ``openai.ChatCompletion`` on the new SDK to prevent triggering the
+    APIRemovedInV1 error.
+    """
+    global _openai_client
+    if _openai_client is None:
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not hasattr(openai, "AsyncOpenAI"):
             openai.api_key = api_key
-            _ = openai.ChatCompletion.create(
-                model="gpt-4-turbo",
-                messages=[{"role": "user", "content": "ping"}],
-                max_tokens=1,
-                temperature=0.0,
-            )
-        OPENAI_AVAILABLE = True
-        print("[AI] OpenAI connectivity test succeeded.")
-    except Exception as e:
-        OPENAI_AVAILABLE = False
-        print("[AI] OpenAI connectivity test failed:", e)
+            return None
+        kwargs = {"api_key": api_key}
+        if _http_client is not None:
+            kwargs["http_client"] = _http_client
+        _openai_client = openai.AsyncOpenAI(**kwargs)
+    return _openai_client
+
 
-from fastapi import FastAPI, Request, Form
-from fastapi.responses import RedirectResponse
+from fastapi import FastAPI, Request, Form, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import (
+    HTMLResponse,
+    JSONResponse,
+    ORJSONResponse,
+    RedirectResponse,
+    Response,
+    StreamingResponse,
+)
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+from .database import (
+    DB_NAME,
+    close_db,
+    init_db,
+    reset_data,
+    insert_batch,
+    optimize,
+    get_all_service_requests,
+    get_all_job_postings,
+    get_recommendation,
+    save_recommendations,
+)
+from .semantic_cache import AVAILABLE as SEMANTIC_CACHE_AVAILABLE, EMBEDDING_MODEL, SemanticCache
+
+
+# Handle on the lock file claimed by the worker that resets the data. It is
+# kept open, and so locked, for the lifetime of that process.
+_reset_lock = None
+
 
-from .database import init_db, reset_data, get_db
+def _claim_reset() -> bool:
+    """Return whether this process should reset the data.
 
+    With ``uvicorn --workers N`` every worker runs the startup code, but only
+    the first one to take an exclusive lock on a file next to the database
+    performs the reset. Platforms without ``fcntl`` always reset.
 
-# Initialize the database once on application startup.
-init_db()
-# Clear all existing data on each server start. This ensures the service
-# requests and job postings tables begin empty every time the application
-# process is started. Remove this call to persist data between runs.
-reset_data()
+    The other workers do not wait for the reset: they may already be
+    accepting submissions, which the reset then deletes. For multi-worker
+    deployments reset the data once before starting the server instead (see
+    the README).
+    """
+    global _reset_lock
+    if fcntl is None:
+        return True
+    lock = open(f"{DB_NAME}.reset-lock", "w")
+    try:
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock.close()
+        return False
+    _reset_lock = lock
+    return True
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Prepare the database and background tasks, and stop them on shutdown.
+
+    The database connections opened while serving requests are long-lived and
+    shared (see :mod:`rallypoint.database`); they are closed here once the
+    queued writes have been flushed. The shared outbound HTTP client is
+    opened here too and exposed as ``app.state.http``.
+
+    Doing this here rather than at import keeps the database untouched until
+    the server starts. Setting ``RALLYPOINT_RESET=1`` clears all service requests and
+    job postings on start, so the development server begins with an empty
+    board; by default data persists between runs.
+    """
+    init_db()
+    if os.getenv("RALLYPOINT_RESET", "0") == "1" and _claim_reset():
+        reset_data()
+    _preload_templates()
+    await _start_optimizer()
+    _start_writer()
+    _start_http_client()
+    app.state.http = _http_client
+    try:
+        yield
+    finally:
+        _stop_optimizer()
+        await _stop_writer()
+        await _stop_generation()
+        await _stop_http_client()
+        close_db()
 
-app = FastAPI(title="Rallypoint", description="Service request and job posting platform", version="0.1.0")
+
+app = FastAPI(
+    title="Rallypoint",
+    description="Service request and job posting platform",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if orjson is not None else JSONResponse,
+)
+
+# Directory containing this package; templates and static assets live here,
+# so the app works regardless of the current working directory.
+BASE_DIR = Path(__file__).resolve().parent
 
 # Configure Jinja2 templates directory. The directory is relative to this file.
-templates = Jinja2Templates(directory="rallypoint/templates")
+# Templates are compiled once and kept in memory: auto-reload is disabled so
+# rendering does not stat the source file on every response. Compiled template
+# bytecode is also written to disk, so fresh worker processes and restarts load
+# it instead of compiling the sources again. Set ``RALLYPOINT_JINJA_CACHE`` to
+# keep that cache somewhere writable when the package directory is not.
+JINJA_CACHE_DIR = Path(os.getenv("RALLYPOINT_JINJA_CACHE", str(BASE_DIR / ".jinja_cache")))
+
+
+def _bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """Return a bytecode cache in :data:`JINJA_CACHE_DIR`.
+
+    Returns ``None`` if the directory cannot be created or written to, e.g.
+    on a read-only install; templates are then compiled in memory only.
+    """
+    try:
+        JINJA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        print("[Templates] Bytecode cache disabled:", e)
+        return None
+    if not os.access(JINJA_CACHE_DIR, os.W_OK):
+        print("[Templates] Bytecode cache disabled: cannot write to", JINJA_CACHE_DIR)
+        return None
+    return FileSystemBytecodeCache(str(JINJA_CACHE_DIR))
+
+
+templates = Jinja2Templates(
+    env=Environment(
+        loader=FileSystemLoader(str(BASE_DIR / "templates")),
+        autoescape=True,
+        auto_reload=False,
+        bytecode_cache=_bytecode_cache(),
+    )
+)
+TEMPLATE_NAMES = (
+    "index.html",
+    "success.html",
+    "admin.html",
+    "postings_head.html",
+    "posting.html",
+    "postings_foot.html",
+)
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def format_timestamp(micros: int) -> str:
+    """Format a ``created_at`` value (UTC microseconds since the epoch) as ISO-8601.
+
+    Timestamps are stored as integers to keep the insert path cheap, so the
+    conversion only happens here, when a page is rendered.
+    """
+    return (_EPOCH + timedelta(microseconds=micros)).isoformat()
+
+
+templates.env.filters["timestamp"] = format_timestamp
 
 # Mount the ``static`` directory for serving CSS/JS assets (currently empty but ready for future use).
-app.mount("/static", StaticFiles(directory="rallypoint/static"), name="static")
+app.mount("/static", StaticFiles(directory=str(BASE_DIR / "static")), name="static")
+
+# Inserts queued by the POST handlers as ``(table, row, future)`` tuples. The
+# queue is created on startup so it belongs to the server's event loop. A
+# ``None`` entry tells the writer to stop once everything before it is written.
+_write_queue: "Optional[asyncio.Queue[Optional[Tuple[str, tuple, Optional[asyncio.Future]]]]]" = None
+_write_task: Optional[asyncio.Task] = None
+
+# How long the writer waits for more rows after the first one arrives, and the
+# largest number of rows committed together.
+WRITE_BATCH_WINDOW = 0.01
+WRITE_BATCH_MAX_ROWS = 100
+
+
+async def _write_batch(batch: List[Tuple[str, tuple, Optional[asyncio.Future]]]) -> None:
+    """Commit a batch of queued rows and resolve any waiting futures.
+
+    The commit runs in a worker thread so the event loop keeps serving
+    requests while SQLite syncs the WAL.
+    """
+    service_rows = [row for table, row, _ in batch if table == "service_requests"]
+    posting_rows = [row for table, row, _ in batch if table == "job_postings"]
+    try:
+        await run_in_threadpool(insert_batch, service_rows, posting_rows)
+    except Exception as e:
+        print("[DB] Error writing batch:", e)
+        for _, _, future in batch:
+            if future is not None and not future.done():
+                future.set_exception(e)
+        return
+    for _, _, future in batch:
+        if future is not None and not future.done():
+            future.set_result(None)
+
+
+async def _flush_writes() -> None:
+    """Background task draining ``_write_queue`` into batched inserts."""
+    loop = asyncio.get_running_loop()
+    while True:
+        item = await _write_queue.get()
+        if item is None:
+            return
+        batch = [item]
+        deadline = loop.time() + WRITE_BATCH_WINDOW
+        while len(batch) < WRITE_BATCH_MAX_ROWS:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(_write_queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if item is None:
+                await _write_batch(batch)
+                return
+            batch.append(item)
+        await _write_batch(batch)
+
+
+async def _queue_insert(table: str, row: tuple, wait: bool = False) -> None:
+    """Queue ``row`` for insertion into ``table``.
+
+    By default this returns as soon as the row is queued. With ``wait=True``
+    it returns once the batch containing the row has been committed, for
+    callers that immediately read the row back.
+    """
+    future = asyncio.get_running_loop().create_future() if wait else None
+    await _write_queue.put((table, row, future))
+    if future is not None:
+        await future
+
+
+# Seconds between ``PRAGMA optimize`` runs.
+OPTIMIZE_INTERVAL = 15 * 60
+_optimize_task: Optional[asyncio.Task] = None
+
+
+async def _optimize_periodically() -> None:
+    """Background task refreshing SQLite planner statistics."""
+    while True:
+        await asyncio.sleep(OPTIMIZE_INTERVAL)
+        try:
+            await run_in_threadpool(optimize)
+        except Exception as e:
+            print("[DB] Error running PRAGMA optimize:", e)
+
+
+async def _start_optimizer() -> None:
+    global _optimize_task
+    await run_in_threadpool(optimize)
+    _optimize_task = asyncio.create_task(_optimize_periodically())
+
+
+def _stop_optimizer() -> None:
+    _optimize_task.cancel()
+
+
+# Pages with no per-request content, rendered once at startup.
+STATIC_PAGE_NAMES = ("index.html", "success.html", "postings_head.html")
+_static_pages: Dict[str, bytes] = {}
+
+# Headers for whole pages served from ``_static_pages``. They only change on
+# deploy, so browsers and proxies may reuse them for a short while.
+STATIC_PAGE_HEADERS = {"Cache-Control": "public, max-age=60"}
+
+
+def _preload_templates() -> None:
+    """Compile every template up front and pre-render the static pages."""
+    for name in TEMPLATE_NAMES:
+        template = templates.get_template(name)
+        if name in STATIC_PAGE_NAMES:
+            _static_pages[name] = template.render().encode("utf-8")
+
+
+def _start_writer() -> None:
+    global _write_queue, _write_task
+    _write_queue = asyncio.Queue()
+    _write_task = asyncio.create_task(_flush_writes())
+
+
+async def _stop_writer() -> None:
+    """Stop the writer once it has committed everything still queued."""
+    await _write_queue.put(None)
+    await _write_task
+
+
+# Mapping of specialty to associated keywords.
+SPECIALTY_KEYWORDS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    # Mechanical work on vehicles, bikes, machinery.
+    "mechanical engineer": ("mechanical", "engine", "bike", "bicycle", "repair", "machine"),
+    # Software and web projects.
+    "software developer": ("app", "software", "website", "backend", "frontend", "fastapi"),
+    # Visual and brand design work.
+    "graphic designer": ("design", "logo", "branding", "graphic"),
+    # Electrical and electronics.
+    "electrical engineer": ("electrical", "circuit", "wiring", "electronics"),
+    # Marketing and promotion.
+    "marketing specialist": ("marketing", "advertising", "promotion", "social media"),
+    # Carpentry and woodworking – removed generic "build" to avoid spurious matches.
+    "carpenter": ("wood", "carpentry", "furniture", "cabinet"),
+    # Aerospace and aircraft construction/maintenance.
+    "aerospace engineer": ("aircraft", "plane", "airplane", "jet", "cessna", "aeronautical"),
+    # Sculptors and artists for statues, sculptures, etc.
+    "sculptor": ("sculpture", "statue", "sculpt", "carve", "model", "art"),
+    # Logistics/transport coordination for delivery and shipping tasks.
+    "logistics coordinator": ("ship", "delivery", "send", "transport", "logistics"),
+    # Pool construction and installation specialists.
+    "pool builder": ("swimming pool", "pool", "pool construction", "water feature", "spa"),
+    # Tiling specialists for flooring and surfaces.
+    "tiler": ("tile", "tiling", "ceramic", "mosaic", "grout"),
+    # Railway and locomotive engineering.
+    "railway engineer": ("train", "locomotive", "rail", "railway"),
+    # Boat and marine construction
+    "boat builder": ("boat", "sailboat", "ship", "yacht", "vessel", "hull", "marine"),
+})
+
+# Per-specialty lookup tables for the heuristic recommendations. They are
+# built once at import and exposed read-only.
+
+# Typical hourly base rate in GBP.
+BASE_RATES: Mapping[str, float] = MappingProxyType({
+    "mechanical engineer": 60.0,
+    "software developer": 70.0,
+    "graphic designer": 50.0,
+    "electrical engineer": 65.0,
+    "marketing specialist": 55.0,
+    "carpenter": 45.0,
+    "aerospace engineer": 90.0,
+    "sculptor": 55.0,
+    "logistics coordinator": 50.0,
+    "pool builder": 60.0,
+    "tiler": 50.0,
+    "railway engineer": 75.0,
+    "generalist contractor": 40.0,
+    "boat builder": 65.0,
+})
+
+# Human‑readable labels describing the major workstream each specialty covers.
+COMPONENT_LABELS: Mapping[str, str] = MappingProxyType({
+    "mechanical engineer": "Mechanical engineering tasks",
+    "software developer": "Software development",
+    "graphic designer": "Design tasks",
+    "electrical engineer": "Electrical engineering tasks",
+    "marketing specialist": "Marketing and promotion",
+    "carpenter": "Carpentry work",
+    "aerospace engineer": "Aerospace engineering tasks",
+    "sculptor": "Sculpture work",
+    "logistics coordinator": "Logistics and delivery",
+    "pool builder": "Pool construction",
+    "tiler": "Tiling work",
+    "railway engineer": "Railway engineering tasks",
+    "generalist contractor": "General contracting tasks",
+    "boat builder": "Boat construction tasks",
+})
+
+# Base time, in weeks, to fill a contract for the specialty. These numbers are
+# heuristic and can be refined with real data.
+TIME_ESTIMATES: Mapping[str, int] = MappingProxyType({
+    "mechanical engineer": 4,
+    "software developer": 3,
+    "graphic designer": 2,
+    "electrical engineer": 4,
+    "marketing specialist": 2,
+    "carpenter": 3,
+    "aerospace engineer": 8,
+    "sculptor": 5,
+    "logistics coordinator": 1,
+    "pool builder": 6,
+    "tiler": 4,
+    "railway engineer": 6,
+    "generalist contractor": 2,
+    "boat builder": 5,
+})
+
+# Fallbacks for specialties missing from the tables above.
+DEFAULT_RATE = 50.0
+DEFAULT_TIME = 2
+
+# Heuristic recommendations are built as named tuples rather than dicts: they
+# are cheaper to create and hold, and templates read them by attribute either
+# way. OpenAI results and the prohibited sentinel remain plain dicts.
+Recommendation = namedtuple(
+    "Recommendation", "specialties num_people estimated_rate components estimated_time tasks"
+)
+Task = namedtuple("Task", "description specialties num_people estimated_time")
+RecommendationResult = Union[Recommendation, Dict[str, object]]
+
+# A running generation task and the index of one description's result in the
+# list the task returns.
+GenerationSlot = Tuple["asyncio.Task[List[RecommendationResult]]", int]
+
+# Words that make a job description ineligible for recommendations. Matched as
+# whole words in any case, so harmless words that merely contain one, such as
+# "bombastic", "gunk" or "Bombay", are not rejected. Inflections and compounds
+# are therefore listed explicitly.
+_PROHIBITED_RE = re.compile(
+    r"\b(?:"
+    r"bomb(?:s|ed|ing|ers?)?"
+    r"|weapon(?:s|ry)?|weaponi[sz](?:e|es|ed|ing)"
+    r"|nuclear"
+    r"|(?:hand|shot|machine)?guns?|gun(?:powder|fire|smiths?|shots?|m[ae]n)"
+    r"|firearms?"
+    r"|explosives?"
+    r"|drugs"
+    r")\b",
+    re.IGNORECASE,
+)
+
+
+def _build_automaton(words: Dict[str, Any]):
+    """Build an Aho-Corasick automaton mapping each word to its value."""
+    automaton = ahocorasick.Automaton()
+    for word, value in words.items():
+        automaton.add_word(word, value)
+    automaton.make_automaton()
+    return automaton
+
+
+# With pyahocorasick available, all keywords are found in a single pass over
+# the description instead of one substring search per keyword.
+_KEYWORD_SPECIALTIES: Dict[str, Tuple[str, ...]] = {}
+for _specialty, _keywords in SPECIALTY_KEYWORDS.items():
+    for _keyword in _keywords:
+        _KEYWORD_SPECIALTIES[_keyword] = _KEYWORD_SPECIALTIES.get(_keyword, ()) + (_specialty,)
+if ahocorasick is not None:
+    _SPECIALTY_AUTOMATON = _build_automaton(_KEYWORD_SPECIALTIES)
+else:
+    _SPECIALTY_AUTOMATON = None
+
+
+def _match_specialties(desc: str) -> List[str]:
+    """Return the specialties whose keywords occur in the lower-cased description.
+
+    Specialties are listed in :data:`SPECIALTY_KEYWORDS` order.
+    """
+    if _SPECIALTY_AUTOMATON is not None:
+        found = set()
+        for _, specialties in _SPECIALTY_AUTOMATON.iter(desc):
+            found.update(specialties)
+        return [specialty for specialty in SPECIALTY_KEYWORDS if specialty in found]
+    return [
+        specialty
+        for specialty, keywords in SPECIALTY_KEYWORDS.items()
+        if any(keyword in desc for keyword in keywords)
+    ]
+
+
+# Recommendations already generated in this process, keyed by description and
+# ordered from least to most recently used.
+_recommendation_cache: "OrderedDict[str, RecommendationResult]" = OrderedDict()
+RECOMMENDATION_CACHE_SIZE = 1024
+
+# Model answers indexed by description embedding, so near-duplicate
+# descriptions reuse them (see :mod:`rallypoint.semantic_cache`). Only used
+# when ``hnswlib`` is installed, since each miss then costs an extra
+# embeddings request.
+_semantic_cache: Optional[SemanticCache] = (
+    SemanticCache() if OPENAI_AVAILABLE and SEMANTIC_CACHE_AVAILABLE else None
+)
+
+# Number of descriptions sent to OpenAI in a single chat completion, and the
+# completion token budget allowed per description.
+RECOMMENDATION_BATCH_SIZE = 8
+RECOMMENDATION_MAX_TOKENS = 200
+
+RECOMMENDATION_SYSTEM_PROMPT = (
+    "You are an expert project planner. You will be given a JSON array of free‑text descriptions of work. "
+    "For each description, infer the most appropriate and specific specialties (trades) required to complete the job. "
+    "Avoid generic labels like 'generalist contractor'—if something isn't obvious, pick the closest relevant trade based on the description. "
+    "Return a JSON array containing exactly one object per description, in the same order as the input. "
+    "Each object must have exactly these keys: \n"
+    "- 'specialties': a list of strings naming the required specialties;\n"
+    "- 'num_people': an integer representing the total recommended team size;\n"
+    "- 'estimated_rate': a float representing the hourly rate per person in pounds;\n"
+    "- 'components': a list of high‑level components of the project;\n"
+    "- 'estimated_time': an integer representing the number of weeks it will take to hire the necessary personnel;\n"
+    "- 'tasks': a list of task objects. Each task object must have: 'description' (string describing the task), "
+    "'specialties' (list of strings naming the specialties for that task), 'num_people' (int number of people required for the task), "
+    "and 'estimated_time' (int weeks to hire for that task).\n"
+    "Do not include any additional keys or any explanatory text outside of the JSON array."
+)
+
+
+async def generate_recommendations(description: str) -> RecommendationResult:
+    """Return staffing recommendations for a single job description.
+
+    See :func:`generate_recommendations_batch`.
+    """
+    return (await generate_recommendations_batch([description]))[0]
+
+
+async def generate_recommendations_batch(descriptions: List[str]) -> List[RecommendationResult]:
+    """Return staffing recommendations for each of ``descriptions``, in order.
+
+    Results depend only on the description, so they are memoised in-process:
+    repeated renders of the job board reuse earlier results instead of
+    re-running the keyword heuristics or calling OpenAI again. Up to
+    :data:`RECOMMENDATION_CACHE_SIZE` results are kept. Heuristic fallbacks
+    for descriptions the model failed to answer are not memoised, so the
+    model is asked again next time. Descriptions already being generated,
+    e.g. by :func:`prefetch_recommendations`, are awaited rather than
+    requested twice.
 
+    Each result is a :class:`Recommendation` named tuple when it comes from
+    the keyword heuristics, or a dict for model output and for the
+    prohibited-content sentinel; templates read either by attribute. Results
+    are shared between callers and must not be mutated.
+    """
+    results, waiting = _schedule_recommendations(descriptions)
+    for description, (task, index) in waiting.items():
+        results[description] = await _await_generation(task, index)
+    return [results[description] for description in descriptions]
+
+
+def prefetch_recommendations(descriptions: List[str]) -> None:
+    """Start generating recommendations for ``descriptions`` without waiting.
+
+    Lets slow OpenAI calls overlap with other work: a later call to
+    :func:`generate_recommendations_batch` picks up the in-flight or finished
+    result.
+    """
+    _schedule_recommendations(descriptions)
+
+
+def _schedule_recommendations(
+    descriptions: List[str],
+) -> Tuple[Dict[str, RecommendationResult], Dict[str, GenerationSlot]]:
+    """Look up or start generation for each of ``descriptions``.
+
+    Returns the memoised results, and for every other description the
+    generation task answering it together with its index in the task's
+    result list. Awaiting those tasks (see :func:`_await_generation`) also
+    yields heuristic fallbacks, which are not memoised, so a caller rendering
+    many descriptions never asks the model twice for the same one.
+    """
+    results: Dict[str, RecommendationResult] = {}
+    waiting: Dict[str, GenerationSlot] = {}
+    pending: List[str] = []
+    for description in dict.fromkeys(descriptions):
+        cached = _recommendation_cache.get(description)
+        if cached is not None:
+            _recommendation_cache.move_to_end(description)
+            results[description] = cached
+        elif description in _inflight_recommendations:
+            waiting[description] = _inflight_recommendations[description]
+        else:
+            pending.append(description)
+    for start in range(0, len(pending), RECOMMENDATION_BATCH_SIZE):
+        batch = pending[start:start + RECOMMENDATION_BATCH_SIZE]
+        task = _start_generation(batch)
+        for index, description in enumerate(batch):
+            waiting[description] = (task, index)
+    return results, waiting
+
+
+async def _await_generation(
+    task: "asyncio.Task[List[RecommendationResult]]", index: int
+) -> RecommendationResult:
+    """Return result ``index`` of a generation task started by :func:`_start_generation`."""
+    # Shielded so a cancelled request does not abort generation that other
+    # requests may be waiting on.
+    return (await asyncio.shield(task))[index]
+
+
+# Generation tasks that have not finished yet, keyed by description, with the
+# index of that description's result in the task's result list.
+_inflight_recommendations: Dict[str, GenerationSlot] = {}
+
+
+# Every running generation task, so shutdown can cancel them before the HTTP
+# client and database connections they use are closed.
+_generation_tasks: Set["asyncio.Task[List[RecommendationResult]]"] = set()
+
+
+def _start_generation(descriptions: List[str]) -> "asyncio.Task[List[RecommendationResult]]":
+    """Generate recommendations for ``descriptions`` in a background task.
+
+    Callers start one task per batch of :data:`RECOMMENDATION_BATCH_SIZE`, so
+    each batch's results become available as soon as its own request returns.
+    """
+    task = asyncio.ensure_future(_generate_and_cache(descriptions))
+    _generation_tasks.add(task)
+    task.add_done_callback(partial(_generation_done, descriptions))
+    for index, description in enumerate(descriptions):
+        _inflight_recommendations[description] = (task, index)
+    return task
+
+
+def _generation_done(descriptions: List[str], task: "asyncio.Task[List[RecommendationResult]]") -> None:
+    """Forget a finished generation task, logging its error if it failed.
+
+    This runs however the task ends, including when it is cancelled before
+    it started, so its descriptions are always released for a later request
+    to generate again. Prefetched tasks may never be awaited, so their
+    exceptions are retrieved here rather than reported as never retrieved.
+    """
+    _generation_tasks.discard(task)
+    for description in descriptions:
+        if _inflight_recommendations.get(description, (None,))[0] is task:
+            del _inflight_recommendations[description]
+    if not task.cancelled() and task.exception() is not None:
+        print("[AI] Error generating recommendations:", task.exception())
+
+
+async def _stop_generation() -> None:
+    """Cancel any generation still running and wait for it to unwind."""
+    for task in _generation_tasks:
+        task.cancel()
+    await asyncio.gather(*_generation_tasks, return_exceptions=True)
+
+
+async def _generate_and_cache(descriptions: List[str]) -> List[RecommendationResult]:
+    """Generate recommendations and store them in the in-process memo.
+
+    The results, named tuples or dicts as described in
+    :func:`generate_recommendations_batch`, are returned in order.
+
+    Fallbacks for descriptions the model failed to answer are left out of the
+    memo.
+    """
+    generated, fallbacks = await _generate_recommendations_uncached(descriptions)
+    for description, result in zip(descriptions, generated):
+        if description not in fallbacks:
+            _recommendation_cache[description] = result
+    while len(_recommendation_cache) > RECOMMENDATION_CACHE_SIZE:
+        _recommendation_cache.popitem(last=False)
+    return generated
+
+
+def _description_hash(description: str) -> str:
+    """Return the key under which model output for ``description`` is stored."""
+    return hashlib.blake2b(description.encode("utf-8")).hexdigest()
+
+
+async def _generate_recommendations_uncached(
+    descriptions: List[str],
+) -> Tuple[List[RecommendationResult], Set[str]]:
+    """Generate recommendations for distinct ``descriptions``, bypassing the memo.
+
+    Prohibited descriptions get a sentinel result. If OpenAI is configured,
+    the rest are answered from stored model output where possible, then from
+    the semantic cache, and the remainder are sent to the model in batches of
+    :data:`RECOMMENDATION_BATCH_SIZE`, all batches concurrently. Anything the
+    model could not answer falls back to :func:`_heuristic_recommendations`.
+
+    Returns the results in order, along with the descriptions that fell back
+    to the heuristics only because a model call failed.
+    """
+    results: Dict[str, RecommendationResult] = {}
+    ai_pending: List[str] = []
+    for description in descriptions:
+        # Guard against harmful or prohibited tasks. If the description contains
+        # keywords associated with weapons or other illegal activities, we return a
+        # sentinel value indicating that no recommendations will be provided.
+        if _PROHIBITED_RE.search(description):
+            results[description] = {
+                "prohibited": True,
+                "message": "Content violates our guidelines and cannot be fulfilled.",
+            }
+        elif OPENAI_AVAILABLE:
+            # Model responses are also stored in the database, keyed by a hash of
+            # the description, so they survive restarts and are shared by workers.
+            stored = get_recommendation(_description_hash(description))
+            if stored is not None:
+                results[description] = json_loads(stored)
+            else:
+                ai_pending.append(description)
+
+    # Reuse the answer given for a sufficiently similar description, if any.
+    # Such answers are approximate, so they are only kept in memory and never
+    # stored under the new description's hash. With an empty index nothing
+    # can match, so the embeddings are then requested alongside the model
+    # call instead of ahead of it, only to index the new answers.
+    embeddings: Dict[str, List[float]] = {}
+    embedding_task = None
+    if ai_pending and _semantic_cache is not None:
+        if len(_semantic_cache):
+            embedded = await _embed_descriptions(ai_pending)
+            if embedded is not None:
+                embeddings = dict(zip(ai_pending, embedded))
+                for description, match in zip(ai_pending, _semantic_cache.lookup(embedded)):
+                    if match is not None:
+                        results[description] = match
+                ai_pending = [description for description in ai_pending if description not in results]
+        else:
+            embedding_task = asyncio.ensure_future(_embed_descriptions(ai_pending))
+
+    # If the OpenAI API is configured, delegate recommendation generation to
+    # the external model. This covers arbitrary tasks beyond the simple
+    # keyword heuristics.
+    if ai_pending:
+        batches = [
+            ai_pending[start:start + RECOMMENDATION_BATCH_SIZE]
+            for start in range(0, len(ai_pending), RECOMMENDATION_BATCH_SIZE)
+        ]
+        try:
+            generated = await asyncio.gather(*(_openai_recommendations(batch) for batch in batches))
+            if embedding_task is not None:
+                embedded = await embedding_task
+                if embedded is not None:
+                    embeddings = dict(zip(ai_pending, embedded))
+        finally:
+            # If this generation is cancelled (e.g. on shutdown), stop the
+            # embeddings request too before the HTTP client is closed.
+            if embedding_task is not None and not embedding_task.done():
+                embedding_task.cancel()
+                await asyncio.gather(embedding_task, return_exceptions=True)
+        for batch, batch_results in zip(batches, generated):
+            if batch_results is not None:
+                results.update(zip(batch, batch_results))
+                for description, result in zip(batch, batch_results):
+                    if description in embeddings:
+                        _semantic_cache.add(embeddings[description], result)
+
+    fallbacks = {description for description in ai_pending if description not in results}
+    return [
+        results[description] if description in results else _heuristic_recommendations(description)
+        for description in descriptions
+    ], fallbacks
+
+
+async def _openai_recommendations(descriptions: List[str]) -> Optional[List[Dict[str, object]]]:
+    """Ask OpenAI for recommendations for several descriptions in one request.
+
+    All descriptions share a single chat completion, so the system prompt and
+    the network round-trip are paid once per batch. Returns ``None`` if the
+    call fails or the response does not have one object per description.
+    """
+    try:
+        # Debug log to indicate that the OpenAI integration is being used
+        print(f"[AI] Calling OpenAI for {len(descriptions)} recommendation(s)…")
+        messages = [
+            {"role": "system", "content": RECOMMENDATION_SYSTEM_PROMPT},
+            {"role": "user", "content": json_dumps(descriptions)},
+        ]
+        # Use the appropriate API based on the installed OpenAI SDK: the
+        # shared client on openai-python >=1.0.0, the legacy module-level
+        # API otherwise.
+        client = get_openai_client()
+        if client is not None:
+            response = await client.chat.completions.create(
+                model="gpt-4-turbo",
+                messages=messages,
+                max_tokens=RECOMMENDATION_MAX_TOKENS * len(descriptions),
+                temperature=0.2,
+            )
+        else:
+            response = await openai.ChatCompletion.acreate(
+                model="gpt-4-turbo",
+                messages=messages,
+                max_tokens=RECOMMENDATION_MAX_TOKENS * len(descriptions),
+                temperature=0.2,
+            )
+        # Extract the assistant message content. In older SDK versions the
+        # response object is dict-like and subscriptable; in newer versions
+        # it is a dataclass with attributes. Try dict-style access first
+        # and fall back to attribute access on TypeError.
+        try:
+            content = response["choices"][0]["message"]["content"]
+        except (TypeError, KeyError, IndexError):
+            content = response.choices[0].message.content
+        # Debug: log the raw model response for troubleshooting. This helps
+        # identify cases where the model might return unexpected values such
+        # as generic 'generalist contractor' recommendations. These prints
+        # will appear in the server console.
+        print("[AI] Raw response:", content)
+        items = json_loads(content)
+        print("[AI] Parsed data:", items)
+        if not isinstance(items, list) or len(items) != len(descriptions):
+            raise ValueError(f"expected a JSON array of {len(descriptions)} objects")
+        # Validate the structure and provide defaults.
+        results = [
+            {
+                "specialties": data.get("specialties", []),
+                "num_people": int(data.get("num_people", 1)),
+                "estimated_rate": float(data.get("estimated_rate", 50.0)),
+                "components": data.get("components", []),
+                "estimated_time": data.get("estimated_time", 0),
+                "tasks": data.get("tasks", []),
+            }
+            for data in items
+        ]
+        # Written from a worker thread: the write lock may be held by a batch
+        # commit, and waiting for it must not stall the event loop.
+        await run_in_threadpool(
+            save_recommendations,
+            [
+                (_description_hash(description), json_dumps(result))
+                for description, result in zip(descriptions, results)
+            ],
+        )
+        return results
+    except Exception as e:
+        # If the API call fails or returns invalid data, the caller falls back
+        # to heuristics. Log the error so users can troubleshoot API issues.
+        print("[AI] Error calling OpenAI:", e)
+        return None
 
-def generate_recommendations(description: str) -> Dict[str, object]:
+
+async def _embed_descriptions(descriptions: List[str]) -> Optional[List[List[float]]]:
+    """Return an OpenAI embedding for each description, in one request.
+
+    Returns ``None`` if the call fails or the legacy SDK is installed.
+    """
+    client = get_openai_client()
+    if client is None:
+        return None
+    try:
+        response = await client.embeddings.create(model=EMBEDDING_MODEL, input=descriptions)
+        return [item.embedding for item in response.data]
+    except Exception as e:
+        print("[AI] Error embedding descriptions:", e)
+        return None
+
+
+def _heuristic_recommendations(description: str) -> Recommendation:
     """Generate a naive staffing recommendation for a job description.
 
     Given a textual description of work to be performed, this function heuristically
     infers which specialties may be required, how many people should be allocated,
     and an estimated hourly rate for the project. It is deliberately simple and
-    intended as a placeholder until a more sophisticated AI model can be
-    integrated (e.g. via an external LLM service).
+    is used when the OpenAI integration is unavailable or fails.
 
     Parameters
     ----------
@@ -112,146 +975,21 @@ def generate_recommendations(description: str) -> Dict[str, object]:
 
     Returns
     -------
-    Dict[str, object]
-        A dictionary with the following keys:
+    Recommendation
+        A named tuple with the following fields:
 
-        * ``specialties`` (List[str]): list of specialties inferred from the description.
+        * ``specialties`` (Tuple[str, ...]): specialties inferred from the description.
         * ``num_people`` (int): recommended number of workers.
         * ``estimated_rate`` (float): suggested hourly rate per worker in GBP.
+        * ``components`` (Tuple[str, ...]): major workstreams, one per specialty.
+        * ``estimated_time`` (int): weeks needed to hire the team.
+        * ``tasks`` (Tuple[Task, ...]): one task per component.
     """
     # Normalise the description for keyword matching.
     desc = description.lower()
 
-    # Guard against harmful or prohibited tasks. If the description contains
-    # keywords associated with weapons or other illegal activities, we return a
-    # sentinel value indicating that no recommendations will be provided.
-    prohibited_keywords = [
-        "bomb",
-        "weapon",
-        "nuclear",
-        "gun",
-        "firearm",
-        "explosive",
-        "drugs",
-    ]
-    if any(word in desc for word in prohibited_keywords):
-        return {
-            "prohibited": True,
-            "message": "Content violates our guidelines and cannot be fulfilled.",
-        }
-
-    # If the OpenAI API passed our connectivity test, delegate recommendation
-    # generation to the external model. This covers arbitrary tasks beyond the
-    # simple keyword heuristics below.
-    if OPENAI_AVAILABLE:
-        try:
-            # Debug log to indicate that the OpenAI integration is being used
-            print("[AI] Calling OpenAI for recommendations…")
-            messages = [
-                {
-                    "role": "system",
-                    "content": (
-                        "You are an expert project planner. Given a free‑text description of work, "
-                        "infer the most appropriate and specific specialties (trades) required to complete the job. "
-                        "Avoid generic labels like 'generalist contractor'—if something isn't obvious, pick the closest relevant trade based on the description. "
-                        "Return a JSON object with exactly these keys: \n"
-                        "- 'specialties': a list of strings naming the required specialties;\n"
-                        "- 'num_people': an integer representing the total recommended team size;\n"
-                        "- 'estimated_rate': a float representing the hourly rate per person in pounds;\n"
-                        "- 'components': a list of high‑level components of the project;\n"
-                        "- 'estimated_time': an integer representing the number of weeks it will take to hire the necessary personnel;\n"
-                        "- 'tasks': a list of task objects. Each task object must have: 'description' (string describing the task), "
-                        "'specialties' (list of strings naming the specialties for that task), 'num_people' (int number of people required for the task), "
-                        "and 'estimated_time' (int weeks to hire for that task).\n"
-                        "Do not include any additional keys or any explanatory text outside of the JSON."
-                    ),
-                },
-                {"role": "user", "content": description},
-            ]
-            # Use the appropriate API based on the installed OpenAI SDK. If
-            # the new-style client class exists (introduced in openai-python
-            # >=1.0.0), instantiate it; otherwise use the legacy API. This
-            # avoids triggering the APIRemovedInV1 error by never accessing
-            # ChatCompletion directly unless it is required by older versions.
-            if hasattr(openai, "OpenAI"):
-                client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-                response = client.chat.completions.create(
-                    model="gpt-4-turbo",
-                    messages=messages,
-                    max_tokens=200,
-                    temperature=0.2,
-                )
-            else:
-                response = openai.ChatCompletion.create(
-                    model="gpt-4-turbo",
-                    messages=messages,
-                    max_tokens=200,
-                    temperature=0.2,
-                )
-            # Extract the assistant message content. In older SDK versions the
-            # response object is dict-like and subscriptable; in newer versions
-            # it is a dataclass with attributes. Try dict-style access first
-            # and fall back to attribute access on TypeError.
-            try:
-                content = response["choices"][0]["message"]["content"]
-            except (TypeError, KeyError, IndexError):
-                content = response.choices[0].message.content
-            # Debug: log the raw model response for troubleshooting. This helps
-            # identify cases where the model might return unexpected values such
-            # as generic 'generalist contractor' recommendations. These prints
-            # will appear in the server console.
-            print("[AI] Raw response:", content)
-            data = json.loads(content)
-            print("[AI] Parsed data:", data)
-            # Validate the structure and provide defaults.
-            return {
-                "specialties": data.get("specialties", []),
-                "num_people": int(data.get("num_people", 1)),
-                "estimated_rate": float(data.get("estimated_rate", 50.0)),
-                "components": data.get("components", []),
-                "estimated_time": data.get("estimated_time", 0),
-                "tasks": data.get("tasks", []),
-            }
-        except Exception as e:
-            # If the API call fails or returns invalid data, fall back to heuristics.
-            # Log the error so users can troubleshoot API issues.
-            print("[AI] Error calling OpenAI:", e)
-            pass
-    # Mapping of specialty to associated keywords.
-    specialty_keywords = {
-        # Mechanical work on vehicles, bikes, machinery.
-        "mechanical engineer": ["mechanical", "engine", "bike", "bicycle", "repair", "machine"],
-        # Software and web projects.
-        "software developer": ["app", "software", "website", "backend", "frontend", "fastapi"],
-        # Visual and brand design work.
-        "graphic designer": ["design", "logo", "branding", "graphic"],
-        # Electrical and electronics.
-        "electrical engineer": ["electrical", "circuit", "wiring", "electronics"],
-        # Marketing and promotion.
-        "marketing specialist": ["marketing", "advertising", "promotion", "social media"],
-        # Carpentry and woodworking – removed generic "build" to avoid spurious matches.
-        "carpenter": ["wood", "carpentry", "furniture", "cabinet"],
-        # Aerospace and aircraft construction/maintenance.
-        "aerospace engineer": ["aircraft", "plane", "airplane", "jet", "cessna", "aeronautical"],
-        # Sculptors and artists for statues, sculptures, etc.
-        "sculptor": ["sculpture", "statue", "sculpt", "carve", "model", "art"],
-        # Logistics/transport coordination for delivery and shipping tasks.
-        "logistics coordinator": ["ship", "delivery", "send", "transport", "logistics"],
-        # Pool construction and installation specialists.
-        "pool builder": ["swimming pool", "pool", "pool construction", "water feature", "spa"],
-        # Tiling specialists for flooring and surfaces.
-        "tiler": ["tile", "tiling", "ceramic", "mosaic", "grout"]
-        ,# Railway and locomotive engineering.
-        "railway engineer": ["train", "locomotive", "rail", "railway"]
-        ,
-        # Boat and marine construction
-        "boat builder": ["boat", "sailboat", "ship", "yacht", "vessel", "hull", "marine"]
-    }
-    matched_specialties: List[str] = []
     # Identify specialties by looking for keyword hits.
-    for specialty, keywords in specialty_keywords.items():
-        if any(keyword in desc for keyword in keywords):
-            matched_specialties.append(specialty)
+    matched_specialties = _match_specialties(desc)
 
     # If no specialty matches, fall back to a generalist recommendation.
     if not matched_specialties:
@@ -260,130 +998,137 @@ def generate_recommendations(description: str) -> Dict[str, object]:
     # Determine the number of people based on the number of specialties and description length.
     base_people = max(1, len(matched_specialties))
     # Longer descriptions likely require more effort.
-    extra_people = len(desc.split()) // 50  # add one extra person for every 50 words
+    extra_people = desc.count(" ") // 50  # add one extra person for every ~50 words
     num_people = base_people + extra_people
     # Certain complex specialties require a minimum team size. For example,
     # building or servicing an aircraft should involve a larger team.
     if "aerospace engineer" in matched_specialties:
         num_people = max(num_people, 3)
 
-    # Estimate a rate. Each specialty has a typical base rate, otherwise use a default.
-    base_rates = {
-        "mechanical engineer": 60.0,
-        "software developer": 70.0,
-        "graphic designer": 50.0,
-        "electrical engineer": 65.0,
-        "marketing specialist": 55.0,
-        "carpenter": 45.0,
-        "aerospace engineer": 90.0,
-        "sculptor": 55.0,
-        "logistics coordinator": 50.0,
-        "pool builder": 60.0,
-        "tiler": 50.0,
-        "railway engineer": 75.0,
-        "generalist contractor": 40.0,
-        "boat builder": 65.0,
-    }
-    # Use the average of specialty rates as the base hourly rate.
-    rates = [base_rates.get(spec, 50.0) for spec in matched_specialties]
-    estimated_rate = sum(rates) / len(rates)
-
-    # Determine components for each specialty. These human‑readable labels describe
-    # the major workstreams that the project will require. Default to a
-    # generic description if a specialty isn't listed.
-    component_labels = {
-        "mechanical engineer": "Mechanical engineering tasks",
-        "software developer": "Software development",
-        "graphic designer": "Design tasks",
-        "electrical engineer": "Electrical engineering tasks",
-        "marketing specialist": "Marketing and promotion",
-        "carpenter": "Carpentry work",
-        "aerospace engineer": "Aerospace engineering tasks",
-        "sculptor": "Sculpture work",
-        "logistics coordinator": "Logistics and delivery",
-        "pool builder": "Pool construction",
-        "tiler": "Tiling work",
-        "railway engineer": "Railway engineering tasks",
-        "generalist contractor": "General contracting tasks",
-        "boat builder": "Boat construction tasks",
-    }
-    components = [component_labels.get(spec, f"{spec} tasks") for spec in matched_specialties]
-
-    # Estimate the time to fill the contract in weeks. Each specialty has a base
-    # time; the overall estimate is the maximum of these. These numbers are
-    # heuristic and can be refined with real data.
-    time_estimates = {
-        "mechanical engineer": 4,
-        "software developer": 3,
-        "graphic designer": 2,
-        "electrical engineer": 4,
-        "marketing specialist": 2,
-        "carpenter": 3,
-        "aerospace engineer": 8,
-        "sculptor": 5,
-        "logistics coordinator": 1,
-        "pool builder": 6,
-        "tiler": 4,
-        "railway engineer": 6,
-        "generalist contractor": 2,
-        "boat builder": 5,
-    }
+    # Walk the specialties once. Each specialty contributes its base rate to
+    # the average hourly rate and its time to fill to the overall estimate
+    # (the maximum, in weeks). It also contributes a component label and a
+    # task describing that major workstream, allocating one person. In a more
+    # sophisticated system the tasks could be derived from further analysis
+    # of the description.
+    rate_sum = 0.0
     estimated_time = 0
+    components: List[str] = []
+    tasks: List[Task] = []
     for spec in matched_specialties:
-        estimated_time = max(estimated_time, time_estimates.get(spec, 2))
+        rate_sum += BASE_RATES.get(spec, DEFAULT_RATE)
+        spec_time = TIME_ESTIMATES.get(spec, DEFAULT_TIME)
+        if spec_time > estimated_time:
+            estimated_time = spec_time
+        label = COMPONENT_LABELS.get(spec, f"{spec} tasks")
+        components.append(label)
+        tasks.append(Task(label, (spec,), 1, spec_time))
+    estimated_rate = round(rate_sum / len(matched_specialties), 2)
 
-    # Build a list of tasks based on the specialties. Each task corresponds to a
-    # major workstream and allocates one person. The estimated time is the
-    # same per-specialty time used above. In a more sophisticated system this
-    # could be derived from further analysis of the description.
-    tasks: List[Dict[str, Any]] = []
-    for spec in matched_specialties:
-        task_desc = component_labels.get(spec, f"{spec} tasks")
-        tasks.append(
-            {
-                "description": task_desc,
-                "specialties": [spec],
-                "num_people": 1,
-                "estimated_time": time_estimates.get(spec, 2),
-            }
-        )
+    return Recommendation(
+        tuple(matched_specialties),
+        num_people,
+        estimated_rate,
+        tuple(components),
+        estimated_time,
+        tuple(tasks),
+    )
+
+
+# Rendered pages keyed by template name, each stored with the context values it
+# was rendered from. The database helpers return the same list object until
+# the underlying table changes, so an identity check tells whether a cached
+# page is still current.
+_page_cache: Dict[str, Tuple[Tuple[Any, ...], bytes]] = {}
+
+
+def _render_cached(name: str, **context: Any) -> bytes:
+    """Render template ``name`` unless it was last rendered from the same objects."""
+    key = tuple(context.values())
+    cached = _page_cache.get(name)
+    if cached is not None and len(cached[0]) == len(key) and all(a is b for a, b in zip(cached[0], key)):
+        return cached[1]
+    body = templates.get_template(name).render(**context).encode("utf-8")
+    _page_cache[name] = (key, body)
+    return body
+
+
+def _parse_form(body: bytes, keys: Tuple[bytes, ...]) -> Dict[str, str]:
+    """Decode the given ``keys`` from an ``application/x-www-form-urlencoded`` body.
+
+    Our forms have at most three fields, so splitting the body by hand and
+    only decoding the values we want is much cheaper than a general-purpose
+    parser. Unknown keys are ignored; for repeated keys the first value wins.
+    """
+    out: Dict[str, str] = {}
+    for pair in body.split(b"&"):
+        key, _, value = pair.partition(b"=")
+        if key in keys and key.decode() not in out:
+            out[key.decode()] = unquote_to_bytes(value.replace(b"+", b" ")).decode("utf-8", "replace")
+    return out
+
+
+# Largest form body accepted by the POST endpoints, in bytes.
+MAX_FORM_BYTES = 16 * 1024
 
-    return {
-        "specialties": matched_specialties,
-        "num_people": num_people,
-        "estimated_rate": round(estimated_rate, 2),
-        "components": components,
-        "estimated_time": estimated_time,
-        "tasks": tasks,
-    }
+
+async def _read_body(request: Request, limit: int) -> bytes:
+    """Read the request body, rejecting it with a 413 once it exceeds ``limit``.
+
+    A declared ``Content-Length`` over the limit is refused before anything is
+    read; otherwise the body is streamed and dropped as soon as it grows past
+    the limit, so oversized uploads are never buffered or decoded in full.
+    """
+    declared = request.headers.get("content-length")
+    if declared is not None:
+        try:
+            too_large = int(declared) > limit
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid Content-Length")
+        if too_large:
+            raise HTTPException(status_code=413, detail="Request body too large")
+    chunks: List[bytes] = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > limit:
+            raise HTTPException(status_code=413, detail="Request body too large")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+async def _read_form(request: Request, *fields: str) -> Tuple[str, ...]:
+    """Return the values of ``fields`` from the request's form body.
+
+    Raises a 400 if any field is missing or empty, so that incomplete rows
+    never reach the batched writer, and a 413 if the body exceeds
+    :data:`MAX_FORM_BYTES`.
+    """
+    body = await _read_body(request, MAX_FORM_BYTES)
+    form = _parse_form(body, tuple(field.encode() for field in fields))
+    values = tuple(form.get(field) for field in fields)
+    if not all(values):
+        raise HTTPException(status_code=400, detail="Missing form field")
+    return values
 
 
 @app.get("/")
 async def index(request: Request):
     """Render the homepage with a service request form."""
-    return templates.TemplateResponse("index.html", {"request": request})
+    return HTMLResponse(_static_pages["index.html"], headers=STATIC_PAGE_HEADERS)
 
 
 @app.post("/submit_request")
 async def submit_request(request: Request):
     """Handle submission of a service request from the homepage form.
 
-    The form data is extracted from ``request.form()`` to avoid requiring the
-    ``python-multipart`` dependency at import time. This also keeps the
-    endpoint signature simple.
+    The urlencoded body is parsed by :func:`_read_form` rather than
+    ``request.form()``, which avoids the ``python-multipart`` dependency and
+    keeps the endpoint signature simple.
     """
-    form = await request.form()
-    name = form.get("name")
-    email = form.get("email")
-    description = form.get("description")
-    created_at = datetime.utcnow().isoformat()
-    with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            "INSERT INTO service_requests (name, email, description, created_at) VALUES (?, ?, ?, ?)",
-            (name, email, description, created_at),
-        )
-        conn.commit()
+    name, email, description = await _read_form(request, "name", "email", "description")
+    created_at = time.time_ns() // 1000
+    await _queue_insert("service_requests", (name, email, description, created_at))
     # Redirect to a thank-you page
     return RedirectResponse(url="/success", status_code=303)
 
@@ -391,76 +1136,115 @@ async def submit_request(request: Request):
 @app.get("/success")
 async def success(request: Request):
     """Display a simple thank-you page after a successful submission."""
-    return templates.TemplateResponse("success.html", {"request": request})
+    return HTMLResponse(_static_pages["success.html"], headers=STATIC_PAGE_HEADERS)
 
 
 @app.get("/admin")
 async def admin_dashboard(request: Request):
-    """Render the admin dashboard showing all service requests and job postings."""
+    """Render the admin dashboard showing all service requests and job postings.
+
+    The page is only re-rendered when either list has changed; otherwise the
+    previously rendered bytes are returned as they are.
+    """
     # Fetch service requests and job postings from the database
-    with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, name, email, description, created_at FROM service_requests ORDER BY created_at DESC")
-        requests = cursor.fetchall()
-        cursor.execute("SELECT id, title, description, created_at FROM job_postings ORDER BY created_at DESC")
-        postings = cursor.fetchall()
-    return templates.TemplateResponse(
-        "admin.html",
-        {
-            "request": request,
-            "service_requests": requests,
-            "job_postings": postings,
-        },
-    )
+    requests = get_all_service_requests()
+    postings = get_all_job_postings()
+    body = _render_cached("admin.html", service_requests=requests, job_postings=postings)
+    return HTMLResponse(body)
 
 
 @app.post("/admin/post_job")
 async def post_job(request: Request):
     """Handle creation of a new job posting from the admin dashboard.
 
-    As with the service request endpoint, we extract form data from the request
-    to avoid requiring ``python-multipart``.
+    As with the service request endpoint, the form body is parsed by
+    :func:`_read_form`.
     """
-    form = await request.form()
-    title = form.get("title")
-    description = form.get("description")
-    created_at = datetime.utcnow().isoformat()
-    with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            "INSERT INTO job_postings (title, description, created_at) VALUES (?, ?, ?)",
-            (title, description, created_at),
-        )
-        conn.commit()
+    title, description = await _read_form(request, "title", "description")
+    created_at = time.time_ns() // 1000
+    # Wait for the commit: the dashboard we redirect to should list the posting.
+    await _queue_insert("job_postings", (title, description, created_at), wait=True)
+    # Start on the recommendations now, so they are usually ready by the time
+    # the job board is next viewed instead of being requested on that GET.
+    prefetch_recommendations([description])
     # Redirect back to the admin dashboard
     return RedirectResponse(url="/admin", status_code=303)
 
 
+# The most recently rendered job board, keyed by its ETag. Only one entry is
+# kept: once a job is posted the old page is never served again.
+_postings_page: Dict[str, bytes] = {}
+
+
+def _postings_etag(rows: List[Any]) -> str:
+    """Return an ETag identifying the job board for ``rows``.
+
+    ``rows`` is newest first, so the first posting's timestamp together with
+    the number of postings changes whenever a job is posted or the board is
+    reset.
+    """
+    newest = rows[0].created_at if rows else 0
+    digest = hashlib.blake2b(f"{newest}:{len(rows)}".encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
 @app.get("/postings")
 async def postings(request: Request):
-    """Render the public job board with AI recommendations for each posting."""
-    with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, title, description, created_at FROM job_postings ORDER BY created_at DESC")
-        rows = cursor.fetchall()
-    # Enrich each posting with AI recommendations
-    enriched_postings: List[Dict[str, object]] = []
+    """Render the public job board with AI recommendations for each posting.
+
+    The page is streamed: the header is sent straight away and each posting
+    follows, in order, as soon as its recommendations are ready.
+    Recommendations for all postings are requested up front in batched OpenAI
+    calls made concurrently, so the whole page takes roughly one round-trip
+    rather than one per posting.
+
+    Once rendered, the page is kept until the next job is posted and is
+    served with an ``ETag``; clients that already have it get a
+    ``304 Not Modified``. A page showing heuristic fallbacks for failed model
+    calls is not kept, so the next request tries the model again.
+    """
+    rows = get_all_job_postings()
+    etag = _postings_etag(rows)
+    headers = {"ETag": etag}
+    if_none_match = request.headers.get("if-none-match")
+    body = _postings_page.get(etag)
+    if body is not None:
+        if if_none_match is not None and etag in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=304, headers=headers)
+        return HTMLResponse(body, headers=headers)
+    return StreamingResponse(_render_postings(rows, etag), media_type="text/html", headers=headers)
+
+
+async def _render_postings(rows: List[Any], etag: str) -> AsyncIterator[bytes]:
+    """Yield the job board page for ``rows`` piece by piece.
+
+    The complete page is stored in :data:`_postings_page` under ``etag``
+    unless some recommendations were not memoised, i.e. were fallbacks.
+    """
+    chunks = [_static_pages["postings_head.html"]]
+    yield chunks[0]
+    # Start every batch up front, then wait on them in row order. Rows are read
+    # from the batch tasks rather than looked up again one by one, so results
+    # that are not memoised (fallbacks for failed model calls) never trigger a
+    # second model request during the same render.
+    ready, waiting = _schedule_recommendations([row.description for row in rows])
+    posting_template = templates.get_template("posting.html")
     for row in rows:
-        job_id, title, description, created_at = row
-        rec = generate_recommendations(description)
-        enriched_postings.append(
-            {
-                "id": job_id,
-                "title": title,
-                "description": description,
-                "created_at": created_at,
-                "recommendations": rec,
-            }
-        )
-    return templates.TemplateResponse(
-        "postings.html",
-        {
-            "request": request,
-            "postings": enriched_postings,
-        },
-    )
\ No newline at end of file
+        rec = ready.get(row.description)
+        if rec is None:
+            rec = await _await_generation(*waiting[row.description])
+        # Enrich each posting with AI recommendations
+        job = {
+            "id": row.id,
+            "title": row.title,
+            "description": row.description,
+            "created_at": row.created_at,
+            "recommendations": rec,
+        }
+        chunks.append(posting_template.render(job=job).encode("utf-8"))
+        yield chunks[-1]
+    chunks.append(templates.get_template("postings_foot.html").render(postings=rows).encode("utf-8"))
+    yield chunks[-1]
+    if all(row.description in _recommendation_cache for row in rows):
+        _postings_page.clear()
+        _postings_page[etag] = b"".join(chunks)
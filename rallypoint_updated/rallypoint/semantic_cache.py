@@ -0,0 +1,75 @@
+"""Approximate-match cache for model recommendations.
+
+Many job descriptions are near-duplicates of one another ("build a wooden
+fence" and "build a garden fence"), which the exact-match caches in
+:mod:`rallypoint.main` never catch. This module keeps the embedding of every
+description the model has answered in an in-memory `hnswlib` index, so a new
+description whose nearest neighbour is similar enough can reuse that answer
+instead of waiting on another chat completion.
+
+``hnswlib`` and ``numpy`` are optional. Without them :data:`AVAILABLE` is
+false and the application skips the semantic cache entirely.
+"""
+
+from typing import Any, List, Optional, Sequence
+
+try:
+    import hnswlib  # type: ignore
+    import numpy as np  # type: ignore
+except ImportError:
+    hnswlib = np = None  # type: ignore
+
+AVAILABLE = hnswlib is not None
+
+# OpenAI embedding model used for descriptions.
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+# Minimum cosine similarity for a cached answer to be reused.
+SIMILARITY_THRESHOLD = 0.92
+
+# The index starts small and doubles as it fills, up to ``MAX_ELEMENTS``;
+# after that new answers are no longer added.
+INITIAL_ELEMENTS = 1024
+MAX_ELEMENTS = 10_000
+
+
+class SemanticCache:
+    """Nearest-neighbour lookup from description embeddings to results.
+
+    The index is only touched from the event loop and none of the methods
+    await, so no locking is needed.
+    """
+
+    def __init__(self, threshold: float = SIMILARITY_THRESHOLD) -> None:
+        # hnswlib's cosine space reports ``1 - similarity`` as the distance.
+        self._max_distance = 1.0 - threshold
+        self._index = None
+        self._results: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def lookup(self, embeddings: Sequence[Sequence[float]]) -> List[Optional[Any]]:
+        """Return the cached result for each embedding, or ``None`` if none is close enough."""
+        if not self._results:
+            return [None] * len(embeddings)
+        labels, distances = self._index.knn_query(np.asarray(embeddings, dtype=np.float32), k=1)
+        return [
+            self._results[label[0]] if distance[0] <= self._max_distance else None
+            for label, distance in zip(labels, distances)
+        ]
+
+    def add(self, embedding: Sequence[float], result: Any) -> None:
+        """Remember ``result`` as the answer for descriptions near ``embedding``."""
+        if self._index is None:
+            # Sized from the first vector rather than hard-coding the model's dimension.
+            self._index = hnswlib.Index(space="cosine", dim=len(embedding))
+            self._index.init_index(max_elements=INITIAL_ELEMENTS)
+        count = len(self._results)
+        capacity = self._index.get_max_elements()
+        if count >= capacity:
+            if capacity >= MAX_ELEMENTS:
+                return
+            self._index.resize_index(min(capacity * 2, MAX_ELEMENTS))
+        self._index.add_items(np.asarray([embedding], dtype=np.float32), [count])
+        self._results.append(result)
@@ -0,0 +1,38 @@
+"""Shared fixtures for the Rallypoint test suite.
+
+Every test gets its own SQLite file in a temporary directory, and OpenAI is
+disabled so recommendations come from the keyword heuristics.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the ``rallypoint`` package importable however pytest is invoked.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from rallypoint import database, main  # noqa: E402
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    """Point the database layer at a fresh file and close it afterwards."""
+    path = str(tmp_path / "rallypoint.db")
+    monkeypatch.setattr(database, "DB_NAME", path)
+    monkeypatch.setattr(main, "DB_NAME", path)
+    yield path
+    database.close_db()
+
+
+@pytest.fixture
+def client(db_path, monkeypatch):
+    """A test client for the app running against ``db_path`` without OpenAI."""
+    from fastapi.testclient import TestClient
+
+    monkeypatch.setattr(main, "OPENAI_AVAILABLE", False)
+    main._recommendation_cache.clear()
+    main._postings_page.clear()
+    main._page_cache.clear()
+    with TestClient(main.app) as test_client:
+        yield test_client
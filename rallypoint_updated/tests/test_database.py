@@ -0,0 +1,110 @@
+"""Tests for :mod:`rallypoint.database`."""
+
+import sqlite3
+from datetime import datetime
+
+from rallypoint import database
+
+
+def _create_legacy_database(path):
+    """Create a database with the original TEXT ``created_at`` columns."""
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        """
+        CREATE TABLE service_requests (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            email TEXT NOT NULL,
+            description TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        );
+        CREATE TABLE job_postings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            title TEXT NOT NULL,
+            description TEXT NOT NULL,
+            created_at TEXT NOT NULL
+        );
+        INSERT INTO service_requests (name, email, description, created_at)
+        VALUES ('Ada', 'ada@example.com', 'fix my bike', '2024-01-02T03:04:05.123456');
+        INSERT INTO job_postings (title, description, created_at)
+        VALUES ('Old', 'paint a fence', '2024-01-01T00:00:00'),
+               ('New', 'build a website', '2024-02-01T12:30:00.500000'),
+               ('Gone', 'deleted posting', '2024-03-01T00:00:00');
+        DELETE FROM job_postings WHERE title = 'Gone';
+        """
+    )
+    conn.commit()
+    conn.close()
+
+
+def _micros(value):
+    return int((datetime.fromisoformat(value) - datetime(1970, 1, 1)).total_seconds() * 1_000_000)
+
+
+def test_init_db_migrates_text_timestamps(db_path):
+    _create_legacy_database(db_path)
+    database.init_db()
+
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == database.SCHEMA_VERSION
+        for table in ("service_requests", "job_postings"):
+            columns = {row[1]: row[2] for row in conn.execute(f"PRAGMA table_info({table})")}
+            assert columns["created_at"] == "INTEGER"
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        assert not any(name.endswith("_legacy") for name in tables)
+    finally:
+        conn.close()
+
+    [request] = database.get_all_service_requests()
+    assert request == (1, "Ada", "ada@example.com", "fix my bike", _micros("2024-01-02T03:04:05.123456"))
+    postings = database.get_all_job_postings()
+    assert [posting.title for posting in postings] == ["New", "Old"]
+    assert postings[0].created_at == _micros("2024-02-01T12:30:00.500000")
+
+    # The id of the deleted posting is not handed out again.
+    database.insert_batch([], [("Site", "build a website", _micros("2024-04-01T00:00:00"))])
+    assert database.get_all_job_postings()[0][:2] == (4, "Site")
+
+
+def test_init_db_is_idempotent(db_path):
+    database.init_db()
+    database.insert_batch([], [("Site", "build a website", 1)])
+    database.init_db()
+    assert [posting.title for posting in database.get_all_job_postings()] == ["Site"]
+
+
+def test_list_cache_is_invalidated_by_any_commit(db_path):
+    database.init_db()
+    database.insert_batch([], [("Site", "build a website", 1)])
+    postings = database.get_all_job_postings()
+    assert database.get_all_job_postings() is postings
+
+    # A commit from another connection, as another worker process would make.
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute(
+            "INSERT INTO job_postings (title, description, created_at) VALUES ('Fence', 'paint a fence', 2)"
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    refreshed = database.get_all_job_postings()
+    assert refreshed is not postings
+    assert [posting.title for posting in refreshed] == ["Fence", "Site"]
+    assert database.get_all_job_postings() is refreshed
+
+
+def test_init_db_skips_schema_at_current_version(db_path):
+    conn = sqlite3.connect(db_path)
+    conn.execute(f"PRAGMA user_version={database.SCHEMA_VERSION}")
+    conn.close()
+
+    database.init_db()
+
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall() == []
+    finally:
+        conn.close()
@@ -0,0 +1,42 @@
+"""Tests for form handling on the POST endpoints in :mod:`rallypoint.main`."""
+
+from rallypoint import main
+from rallypoint.database import get_all_job_postings
+
+
+def test_parse_form_decodes_only_the_requested_keys():
+    body = b"name=Ada+L&extra=1&email=ada%40example.com&name=Bob&description=caf%C3%A9"
+    assert main._parse_form(body, (b"name", b"email", b"description")) == {
+        "name": "Ada L",
+        "email": "ada@example.com",
+        "description": "caf\u00e9",
+    }
+
+
+def test_missing_form_field_is_rejected(client):
+    response = client.post("/submit_request", data={"name": "Ada", "email": "ada@example.com"})
+    assert response.status_code == 400
+    response = client.post("/admin/post_job", data={"title": "Site", "description": ""})
+    assert response.status_code == 400
+    assert get_all_job_postings() == []
+
+
+def test_oversized_body_is_rejected(client):
+    description = "x" * (main.MAX_FORM_BYTES + 1)
+    response = client.post(
+        "/submit_request",
+        data={"name": "Ada", "email": "ada@example.com", "description": description},
+    )
+    assert response.status_code == 413
+
+
+def test_oversized_streamed_body_is_rejected(client):
+    # An iterable body is sent chunked, without a Content-Length to check.
+    chunk = b"description=" + b"x" * main.MAX_FORM_BYTES
+    response = client.post(
+        "/admin/post_job",
+        content=iter([b"title=Site&", chunk]),
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    assert response.status_code == 413
+    assert get_all_job_postings() == []
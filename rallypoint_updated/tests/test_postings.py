@@ -0,0 +1,18 @@
+"""Tests for the ``/postings`` page in :mod:`rallypoint.main`."""
+
+
+def test_postings_conditional_get(client):
+    client.post("/admin/post_job", data={"title": "Site", "description": "build a website"})
+    first = client.get("/postings")
+    etag = first.headers["etag"]
+
+    cached = client.get("/postings", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert cached.content == b""
+
+    client.post("/admin/post_job", data={"title": "Fence", "description": "paint a fence"})
+    changed = client.get("/postings", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert "paint a fence" in changed.text
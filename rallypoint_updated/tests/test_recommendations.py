@@ -0,0 +1,196 @@
+"""Tests for the recommendation helpers in :mod:`rallypoint.main`."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from rallypoint import main
+
+
+@pytest.mark.parametrize(
+    "description",
+    [
+        "make a bomb",
+        "Bombs for a film set",
+        "bombing run",
+        "a bomber jacket",
+        "bombed out warehouse",
+        "gunpowder supplier",
+        "need a gunsmith",
+        "gunfire sound effects",
+        "fix my machinegun",
+        "handgun repair",
+        "shotguns",
+        "weaponize the drone",
+        "a weaponized robot",
+        "weaponise it",
+        "weaponry store",
+        "weaponising drones",
+        "gunman",
+        "gunshots heard",
+        "NUCLEAR plant",
+        "firearms training",
+        "explosives expert",
+        "sell drugs",
+    ],
+)
+def test_prohibited_words_are_rejected(description):
+    assert main._PROHIBITED_RE.search(description)
+
+
+@pytest.mark.parametrize(
+    "description",
+    [
+        "a bombastic speech writer",
+        "the work has begun",
+        "replace the gunwale on my boat",
+        "paint the gunnel",
+        "clean the gunk out of my gutters",
+        "gunmetal grey paint",
+        "gunny sacks for the garden",
+        "Gunnar needs a fence",
+        "Bombay Sapphire bar fitout",
+        "build a website",
+    ],
+)
+def test_harmless_words_are_allowed(description):
+    assert not main._PROHIBITED_RE.search(description)
+
+
+def test_prohibited_description_gets_no_recommendations(monkeypatch):
+    monkeypatch.setattr(main, "OPENAI_AVAILABLE", False)
+    [result], _ = asyncio.run(main._generate_recommendations_uncached(["Build a bomber drone"]))
+    assert result["prohibited"] is True
+
+
+def test_fallback_for_failed_model_call_is_not_memoised(monkeypatch):
+    answer = {"specialties": ["ai"], "num_people": 1, "estimated_rate": 1.0,
+              "components": [], "estimated_time": 1, "tasks": []}
+    replies = [None, [answer]]
+
+    async def fake_openai(descriptions):
+        return replies.pop(0)
+
+    monkeypatch.setattr(main, "OPENAI_AVAILABLE", True)
+    monkeypatch.setattr(main, "_semantic_cache", None)
+    monkeypatch.setattr(main, "get_recommendation", lambda description_hash: None)
+    monkeypatch.setattr(main, "_openai_recommendations", fake_openai)
+    main._recommendation_cache.clear()
+
+    first = asyncio.run(main.generate_recommendations("build a website"))
+    assert isinstance(first, main.Recommendation)
+    assert "build a website" not in main._recommendation_cache
+
+    second = asyncio.run(main.generate_recommendations("build a website"))
+    assert second == answer
+    assert main._recommendation_cache["build a website"] == answer
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "[]",
+        '[{"specialties": ["web"]}]',
+        '{"specialties": ["web"]}',
+        "Sorry, I can't help with that.",
+    ],
+)
+def test_malformed_batch_response_falls_back_to_heuristics(monkeypatch, content):
+    saved = []
+
+    async def create(**kwargs):
+        message = SimpleNamespace(content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(main, "OPENAI_AVAILABLE", True)
+    monkeypatch.setattr(main, "_semantic_cache", None)
+    monkeypatch.setattr(main, "get_recommendation", lambda description_hash: None)
+    monkeypatch.setattr(main, "get_openai_client", lambda: client)
+    monkeypatch.setattr(main, "save_recommendations", saved.append)
+    main._recommendation_cache.clear()
+
+    descriptions = ["build a website", "fix my bike"]
+    assert asyncio.run(main._openai_recommendations(descriptions)) is None
+    results = asyncio.run(main.generate_recommendations_batch(descriptions))
+    assert all(isinstance(result, main.Recommendation) for result in results)
+    assert not main._recommendation_cache
+    assert saved == []
+
+
+def test_shutdown_cancels_prefetched_generation(db_path, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    async def slow_openai(descriptions):
+        await asyncio.sleep(60)
+
+    monkeypatch.setattr(main, "OPENAI_AVAILABLE", True)
+    monkeypatch.setattr(main, "_semantic_cache", None)
+    monkeypatch.setattr(main, "get_recommendation", lambda description_hash: None)
+    monkeypatch.setattr(main, "_openai_recommendations", slow_openai)
+    main._recommendation_cache.clear()
+
+    with TestClient(main.app) as client:
+        response = client.post(
+            "/admin/post_job",
+            data={"title": "Site", "description": "build a website"},
+            follow_redirects=False,
+        )
+        assert response.status_code == 303
+        assert main._generation_tasks
+    assert not main._generation_tasks
+
+
+def test_failed_batches_call_the_model_once_each(monkeypatch):
+    calls = []
+
+    async def failing_openai(descriptions):
+        calls.append(len(descriptions))
+        return None
+
+    monkeypatch.setattr(main, "OPENAI_AVAILABLE", True)
+    monkeypatch.setattr(main, "_semantic_cache", None)
+    monkeypatch.setattr(main, "get_recommendation", lambda description_hash: None)
+    monkeypatch.setattr(main, "_openai_recommendations", failing_openai)
+    main._recommendation_cache.clear()
+
+    descriptions = [f"build website number {i}" for i in range(20)]
+    results = asyncio.run(main.generate_recommendations_batch(descriptions))
+    assert calls == [8, 8, 4]
+    assert all(isinstance(result, main.Recommendation) for result in results)
+    assert not main._recommendation_cache
+
+
+def test_postings_with_failing_model_call_it_once_per_batch(client, monkeypatch):
+    for i in range(10):
+        client.post("/admin/post_job", data={"title": f"Job {i}", "description": f"build website {i}"})
+    calls = []
+
+    async def failing_openai(descriptions):
+        calls.append(len(descriptions))
+        return None
+
+    monkeypatch.setattr(main, "OPENAI_AVAILABLE", True)
+    monkeypatch.setattr(main, "_semantic_cache", None)
+    monkeypatch.setattr(main, "get_recommendation", lambda description_hash: None)
+    monkeypatch.setattr(main, "_openai_recommendations", failing_openai)
+    main._recommendation_cache.clear()
+
+    response = client.get("/postings")
+    assert response.status_code == 200
+    assert response.text.count('class="job-card"') == 10
+    assert sorted(calls) == [2, 8]
+
+
+def test_description_can_be_generated_again_after_shutdown(monkeypatch):
+    monkeypatch.setattr(main, "OPENAI_AVAILABLE", False)
+    main._recommendation_cache.clear()
+
+    async def scenario():
+        main._start_generation(["build a website"])
+        await main._stop_generation()
+        assert "build a website" not in main._inflight_recommendations
+        return await main.generate_recommendations("build a website")
+
+    assert isinstance(asyncio.run(scenario()), main.Recommendation)
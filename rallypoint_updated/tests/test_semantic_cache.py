@@ -0,0 +1,80 @@
+"""Tests for the semantic recommendation cache."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("hnswlib")
+
+from rallypoint import main  # noqa: E402
+from rallypoint.semantic_cache import SemanticCache  # noqa: E402
+
+
+def test_lookup_matches_only_similar_embeddings():
+    cache = SemanticCache()
+    assert cache.lookup([[1.0, 0.0, 0.0]]) == [None]
+    cache.add([1.0, 0.0, 0.0], "fence")
+    cache.add([0.0, 1.0, 0.0], "website")
+    assert cache.lookup([[0.99, 0.05, 0.0], [0.5, 0.5, 0.0]]) == ["fence", None]
+
+
+def test_semantic_hits_are_not_persisted(monkeypatch):
+    vectors = {"build a wooden fence": [1.0, 0.0], "build a garden fence": [0.99, 0.05]}
+    embedded, asked, saved = [], [], []
+
+    async def fake_embed(descriptions):
+        embedded.append(list(descriptions))
+        return [vectors[description] for description in descriptions]
+
+    async def fake_openai(descriptions):
+        asked.append(list(descriptions))
+        return [{"specialties": ["carpenter"]} for _ in descriptions]
+
+    monkeypatch.setattr(main, "OPENAI_AVAILABLE", True)
+    monkeypatch.setattr(main, "_semantic_cache", SemanticCache())
+    monkeypatch.setattr(main, "get_recommendation", lambda description_hash: None)
+    monkeypatch.setattr(main, "save_recommendations", saved.append)
+    monkeypatch.setattr(main, "_embed_descriptions", fake_embed)
+    monkeypatch.setattr(main, "_openai_recommendations", fake_openai)
+
+    asyncio.run(main._generate_recommendations_uncached(["build a wooden fence"]))
+    assert asked == [["build a wooden fence"]]
+    assert len(main._semantic_cache) == 1
+
+    [result], fallbacks = asyncio.run(
+        main._generate_recommendations_uncached(["build a garden fence"])
+    )
+    assert result == {"specialties": ["carpenter"]}
+    assert not fallbacks
+    assert asked == [["build a wooden fence"]]
+    assert embedded == [["build a wooden fence"], ["build a garden fence"]]
+    assert saved == []
+
+
+def test_cancelling_generation_cancels_the_embeddings_request(monkeypatch):
+    events = []
+
+    async def slow_embed(descriptions):
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            events.append("embedding cancelled")
+            raise
+
+    async def slow_openai(descriptions):
+        await asyncio.sleep(60)
+
+    monkeypatch.setattr(main, "OPENAI_AVAILABLE", True)
+    monkeypatch.setattr(main, "_semantic_cache", SemanticCache())
+    monkeypatch.setattr(main, "get_recommendation", lambda description_hash: None)
+    monkeypatch.setattr(main, "_embed_descriptions", slow_embed)
+    monkeypatch.setattr(main, "_openai_recommendations", slow_openai)
+    main._recommendation_cache.clear()
+
+    async def scenario():
+        main._start_generation(["build a wooden fence"])
+        await asyncio.sleep(0.01)
+        await main._stop_generation()
+
+    asyncio.run(scenario())
+    assert events == ["embedding cancelled"]
@@ -0,0 +1,37 @@
+"""Tests for the template setup in :mod:`rallypoint.main`."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+PACKAGE_PARENT = str(Path(__file__).resolve().parents[1])
+
+
+def test_postings_escapes_descriptions(client):
+    client.post("/admin/post_job", data={"title": "Site", "description": "<script>build</script>"})
+    response = client.get("/postings")
+    assert response.status_code == 200
+    assert "&lt;script&gt;build&lt;/script&gt;" in response.text
+    assert "<script>build" not in response.text
+
+
+def test_unwritable_bytecode_cache_is_skipped(tmp_path):
+    # A cache directory below a regular file can never be created.
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+    env = dict(os.environ, RALLYPOINT_JINJA_CACHE=str(blocker / "cache"), PYTHONPATH=PACKAGE_PARENT)
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from rallypoint.main import templates;"
+            "assert templates.env.bytecode_cache is None;"
+            "templates.get_template('index.html').render()",
+        ],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert "Bytecode cache disabled" in result.stdout
@@ -0,0 +1,68 @@
+"""Tests for the batched background writer in :mod:`rallypoint.main`."""
+
+import asyncio
+
+from rallypoint import database, main
+from rallypoint.database import get_all_service_requests
+
+
+def _request(number):
+    return ("Ada", "ada@example.com", f"job {number}", number)
+
+
+def _descriptions_by_id():
+    return [row.description for row in sorted(get_all_service_requests())]
+
+
+def test_submit_request_is_stored(client):
+    response = client.post(
+        "/submit_request",
+        data={"name": "Ada", "email": "ada@example.com", "description": "fix my bike"},
+        follow_redirects=False,
+    )
+    assert response.status_code == 303
+    assert response.headers["location"] == "/success"
+    # Job postings wait for their batch to commit, and the queue is written in
+    # order, so the service request is in the database once this returns.
+    client.post("/admin/post_job", data={"title": "Sync", "description": "wait for the writer"})
+    [row] = get_all_service_requests()
+    assert (row.name, row.email, row.description) == ("Ada", "ada@example.com", "fix my bike")
+
+
+def test_queued_rows_are_committed_in_order(db_path, monkeypatch):
+    batches = []
+
+    def insert_batch(service_requests, job_postings):
+        batches.append(len(service_requests) + len(job_postings))
+        database.insert_batch(service_requests, job_postings)
+
+    monkeypatch.setattr(main, "insert_batch", insert_batch)
+    database.init_db()
+
+    async def scenario():
+        main._start_writer()
+        for number in range(50):
+            await main._queue_insert("service_requests", _request(number))
+        # Returns only once the batch holding this row, and so every row
+        # queued before it, has been committed.
+        await main._queue_insert("job_postings", ("Sync", "wait for the writer", 50), wait=True)
+        assert _descriptions_by_id() == [f"job {number}" for number in range(50)]
+        await main._stop_writer()
+
+    asyncio.run(scenario())
+    assert sum(batches) == 51
+    assert len(batches) < 51
+
+
+def test_stopping_the_writer_flushes_the_queue(db_path):
+    count = main.WRITE_BATCH_MAX_ROWS + 20
+    database.init_db()
+
+    async def scenario():
+        main._start_writer()
+        for number in range(count):
+            await main._queue_insert("service_requests", _request(number))
+        await main._stop_writer()
+
+    asyncio.run(scenario())
+    assert _descriptions_by_id() == [f"job {number}" for number in range(count)]